@@ -1902,6 +1902,11 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 					# stops the EventBus with clear=True, and recreates a fresh EventBus
 					await self.browser_session.kill()
 
+			# Release the cloud sync HTTP connection
+			cloud_sync = getattr(self, 'cloud_sync', None)
+			if cloud_sync is not None:
+				await cloud_sync.close()
+
 			# Force garbage collection
 			gc.collect()
 
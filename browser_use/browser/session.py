@@ -39,7 +39,7 @@ from browser_use.browser.events import (
 from browser_use.browser.profile import BrowserProfile, ProxySettings
 from browser_use.browser.views import BrowserStateSummary, TabInfo
 from browser_use.dom.views import EnhancedDOMTreeNode, TargetInfo
-from browser_use.utils import _log_pretty_url, is_new_tab_page
+from browser_use.utils import is_new_tab_page
 
 DEFAULT_BROWSER_PROFILE = BrowserProfile()
 
@@ -356,6 +356,7 @@ class BrowserSession(BaseModel):
 	_dom_watchdog: Any | None = PrivateAttr(default=None)
 	_screenshot_watchdog: Any | None = PrivateAttr(default=None)
 	_permissions_watchdog: Any | None = PrivateAttr(default=None)
+	_watchdogs_attached: bool = PrivateAttr(default=False)
 
 	_logger: Any = PrivateAttr(default=None)
 
@@ -932,7 +933,7 @@ class BrowserSession(BaseModel):
 	async def attach_all_watchdogs(self) -> None:
 		"""Initialize and attach all watchdogs with explicit handler registration."""
 		# Prevent duplicate watchdog attachment
-		if hasattr(self, '_watchdogs_attached') and self._watchdogs_attached:
+		if self._watchdogs_attached:
 			self.logger.debug('Watchdogs already attached, skipping duplicate attachment')
 			return
 
@@ -1339,58 +1340,41 @@ class BrowserSession(BaseModel):
 			self.logger.debug(f'Skipping proxy auth setup: {type(e).__name__}: {e}')
 
 	async def get_tabs(self) -> list[TabInfo]:
-		"""Get information about all open tabs using CDP Target.getTargetInfo for speed."""
+		"""Get information about all open tabs using CDP Target.getTargets for speed."""
 		tabs = []
 
 		# Safety check - return empty list if browser not connected yet
 		if not self._cdp_client_root:
 			return tabs
 
-		# Get all page targets using CDP
+		# Get all page targets using CDP, the TargetInfo dicts already include the title
 		pages = await self._cdp_get_all_pages()
 
-		for i, page_target in enumerate(pages):
+		for page_target in pages:
 			target_id = page_target['targetId']
 			url = page_target['url']
+			title = page_target.get('title', '')
 
-			# Try to get the title directly from Target.getTargetInfo - much faster!
-			# The initial getTargets() doesn't include title, but getTargetInfo does
-			try:
-				target_info = await self.cdp_client.send.Target.getTargetInfo(params={'targetId': target_id})
-				# The title is directly available in targetInfo
-				title = target_info.get('targetInfo', {}).get('title', '')
-
-				# Skip JS execution for chrome:// pages and new tab pages
-				if is_new_tab_page(url) or url.startswith('chrome://'):
-					# Use URL as title for chrome pages, or mark new tabs as unusable
-					if is_new_tab_page(url):
-						title = 'ignore this tab and do not use it'
-					elif not title:
-						# For chrome:// pages without a title, use the URL itself
-						title = url
-
-				# Special handling for PDF pages without titles
-				if (not title or title == '') and (url.endswith('.pdf') or 'pdf' in url):
-					# PDF pages might not have a title, use URL filename
-					try:
-						from urllib.parse import urlparse
-
-						filename = urlparse(url).path.split('/')[-1]
-						if filename:
-							title = filename
-					except Exception:
-						pass
-
-			except Exception as e:
-				# Fallback to basic title handling
-				self.logger.debug(f'⚠️ Failed to get target info for tab #{i}: {_log_pretty_url(url)} - {type(e).__name__}')
-
+			# Skip JS execution for chrome:// pages and new tab pages
+			if is_new_tab_page(url) or url.startswith('chrome://'):
+				# Use URL as title for chrome pages, or mark new tabs as unusable
 				if is_new_tab_page(url):
 					title = 'ignore this tab and do not use it'
-				elif url.startswith('chrome://'):
+				elif not title:
+					# For chrome:// pages without a title, use the URL itself
 					title = url
-				else:
-					title = ''
+
+			# Special handling for PDF pages without titles
+			if (not title or title == '') and (url.endswith('.pdf') or 'pdf' in url):
+				# PDF pages might not have a title, use URL filename
+				try:
+					from urllib.parse import urlparse
+
+					filename = urlparse(url).path.split('/')[-1]
+					if filename:
+						title = filename
+				except Exception:
+					pass
 
 			tab_info = TabInfo(
 				target_id=target_id,
@@ -1495,7 +1479,6 @@ class BrowserSession(BaseModel):
 
 	async def get_most_recently_opened_target_id(self) -> TargetID:
 		"""Get the most recently opened target ID."""
-		all_targets = await self.cdp_client.send.Target.getTargets()
 		return (await self._cdp_get_all_pages())[-1]['targetId']
 
 	def is_file_input(self, element: Any) -> bool:
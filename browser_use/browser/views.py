@@ -1,4 +1,6 @@
+import base64
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 from bubus import BaseEvent
@@ -101,9 +103,6 @@ class BrowserStateHistory:
 		if not self.screenshot_path:
 			return None
 
-		import base64
-		from pathlib import Path
-
 		path_obj = Path(self.screenshot_path)
 		if not path_obj.exists():
 			return None
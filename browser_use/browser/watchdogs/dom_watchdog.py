@@ -1,6 +1,7 @@
 """DOM watchdog for browser DOM tree management using CDP."""
 
 import asyncio
+import logging
 import time
 from typing import TYPE_CHECKING
 
@@ -176,7 +177,8 @@ class DOMWatchdog(BaseWatchdog):
 		self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting tabs info...')
 		tabs_info = await self.browser_session.get_tabs()
 		self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got {len(tabs_info)} tabs')
-		self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Tabs info: {tabs_info}')
+		if self.logger.isEnabledFor(logging.DEBUG):
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Tabs info: {tabs_info}')
 
 		# Get viewport / scroll position info, remember changing scroll position should invalidate selector_map cache because it only includes visible elements
 		# cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
@@ -272,9 +274,10 @@ class DOMWatchdog(BaseWatchdog):
 				)
 				try:
 					# Check if handler is registered
-					handlers = self.event_bus.handlers.get('ScreenshotEvent', [])
-					handler_names = [getattr(h, '__name__', str(h)) for h in handlers]
-					self.logger.debug(f'📸 ScreenshotEvent handlers registered: {len(handlers)} - {handler_names}')
+					if self.logger.isEnabledFor(logging.DEBUG):
+						handlers = self.event_bus.handlers.get('ScreenshotEvent', [])
+						handler_names = [getattr(h, '__name__', str(h)) for h in handlers]
+						self.logger.debug(f'📸 ScreenshotEvent handlers registered: {len(handlers)} - {handler_names}')
 
 					screenshot_event = self.event_bus.dispatch(ScreenshotEvent(full_page=False))
 					self.logger.debug('📸 Dispatched ScreenshotEvent, waiting for event to complete...')
@@ -292,16 +295,10 @@ class DOMWatchdog(BaseWatchdog):
 			else:
 				self.logger.debug(f'📸 Skipping screenshot, include_screenshot={event.include_screenshot}')
 
-			# Tabs info already fetched at the beginning
-
-			# Get target title safely
-			try:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page title...')
-				title = await asyncio.wait_for(self.browser_session.get_current_page_title(), timeout=2.0)
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}')
-			except Exception as e:
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get title: {e}')
-				title = 'Page'
+			# Title of the focused tab from tabs_info (fetched above, before the DOM build and screenshot)
+			focused_target_id = self.browser_session.agent_focus.target_id
+			title = next((tab.title for tab in tabs_info if tab.target_id == focused_target_id), 'Page')
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}')
 
 			# Get comprehensive page info from CDP
 			try:
@@ -360,9 +360,10 @@ class DownloadsWatchdog(BaseWatchdog):
 
 		# Poll for new files
 		max_wait = 20  # seconds
-		start_time = asyncio.get_event_loop().time()
+		loop = asyncio.get_running_loop()
+		start_time = loop.time()
 
-		while asyncio.get_event_loop().time() - start_time < max_wait:
+		while loop.time() - start_time < max_wait:
 			await asyncio.sleep(2.0)  # Check every 2 seconds
 
 			if Path(downloads_dir).exists():
@@ -356,11 +356,13 @@ class LocalBrowserWatchdog(BaseWatchdog):
 		"""Wait for the browser to start and return the CDP URL."""
 		import aiohttp
 
-		start_time = asyncio.get_event_loop().time()
+		loop = asyncio.get_running_loop()
+		start_time = loop.time()
 
-		while asyncio.get_event_loop().time() - start_time < timeout:
-			try:
-				async with aiohttp.ClientSession() as session:
+		# Reuse one client session (and its connection pool) for every probe instead of reconnecting each time
+		async with aiohttp.ClientSession() as session:
+			while loop.time() - start_time < timeout:
+				try:
 					async with session.get(f'http://localhost:{port}/json/version') as resp:
 						if resp.status == 200:
 							# Chrome is ready
@@ -368,9 +370,9 @@ class LocalBrowserWatchdog(BaseWatchdog):
 						else:
 							# Chrome is starting up and returning 502/500 errors
 							await asyncio.sleep(0.1)
-			except Exception:
-				# Connection error - Chrome might not be ready yet
-				await asyncio.sleep(0.1)
+				except Exception:
+					# Connection error - Chrome might not be ready yet
+					await asyncio.sleep(0.1)
 
 		raise TimeoutError(f'Browser did not start within {timeout} seconds')
 
@@ -5,6 +5,8 @@ Cloud sync service for sending events to the Browser Use cloud.
 import asyncio
 import logging
 import shutil
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import httpx
 from bubus import BaseEvent
@@ -26,6 +28,42 @@ class CloudSync:
 		self.pending_events: list[BaseEvent] = []
 		self.auth_task = None
 		self.session_id: str | None = None
+		self._client: httpx.AsyncClient | None = None
+		self._client_requests_in_flight = 0
+		self._close_client_when_idle = False
+
+	@asynccontextmanager
+	async def _borrow_client(self, client: httpx.AsyncClient | None = None) -> AsyncIterator[httpx.AsyncClient]:
+		"""Lend out an HTTP client for one request"""
+		if client is not None:
+			yield client
+			return
+
+		if self._client is None or self._client.is_closed:
+			self._client = httpx.AsyncClient()
+		self._client_requests_in_flight += 1
+		try:
+			yield self._client
+		finally:
+			self._client_requests_in_flight -= 1
+			if self._close_client_when_idle and not self._client_requests_in_flight:
+				await self._close_client()
+
+	async def _close_client(self) -> None:
+		"""Close and drop the shared HTTP client"""
+		client, self._client = self._client, None
+		self._close_client_when_idle = False
+		if client is not None and not client.is_closed:
+			await client.aclose()
+
+	async def close(self) -> None:
+		"""Close the shared HTTP client once no request is using it"""
+		if self._client_requests_in_flight:
+			# Another sender (e.g. a concurrent agent sharing this CloudSync) is mid-request,
+			# let the last in-flight request close the client instead of cutting its POST off
+			self._close_client_when_idle = True
+			return
+		await self._close_client()
 
 	async def handle_event(self, event: BaseEvent) -> None:
 		"""Handle an event by sending it to the cloud"""
@@ -35,12 +73,12 @@ class CloudSync:
 				self.session_id = str(event.id)  # type: ignore
 
 			# Start authentication flow on first step (after first LLM response)
-			if event.event_type == 'CreateAgentStepEvent' and 'step' in dict(event):
-				step = dict(event)['step']
+			if event.event_type == 'CreateAgentStepEvent':
+				step = getattr(event, 'step', None)
 				# logger.debug(f'Got CreateAgentStepEvent with step={step}')
 				# Trigger on the first step (step=2 because n_steps is incremented before actions)
 				if step == 2 and self.enable_auth and self.auth_client:
-					if not hasattr(self, 'auth_task') or self.auth_task is None:
+					if self.auth_task is None:
 						# Start auth in background
 						if self.session_id:
 							# logger.info('Triggering auth on first step event')
@@ -55,7 +93,7 @@ class CloudSync:
 		except Exception as e:
 			logger.error(f'Failed to handle {event.event_type} event: {type(e).__name__}: {e}', exc_info=True)
 
-	async def _send_event(self, event: BaseEvent) -> None:
+	async def _send_event(self, event: BaseEvent, client: httpx.AsyncClient | None = None) -> None:
 		"""Send event to cloud API"""
 		try:
 			headers = {}
@@ -70,28 +108,28 @@ class CloudSync:
 			if self.auth_client:
 				headers.update(self.auth_client.get_headers())
 
-			# Send event (batch format with direct BaseEvent serialization)
-			async with httpx.AsyncClient() as client:
-				# Serialize event and add device_id to all events
-				event_data = event.model_dump(mode='json')
-				if self.auth_client and self.auth_client.device_id:
-					event_data['device_id'] = self.auth_client.device_id
+			# Serialize event and add device_id to all events
+			event_data = event.model_dump(mode='json')
+			if self.auth_client and self.auth_client.device_id:
+				event_data['device_id'] = self.auth_client.device_id
 
-				response = await client.post(
+			# Send event (batch format with direct BaseEvent serialization)
+			async with self._borrow_client(client) as http_client:
+				response = await http_client.post(
 					f'{self.base_url.rstrip("/")}/api/v1/events',
 					json={'events': [event_data]},
 					headers=headers,
 					timeout=10.0,
 				)
 
-				if response.status_code == 401 and self.auth_client and not self.auth_client.is_authenticated:
-					# Store event for retry after auth
-					self.pending_events.append(event)
-				elif response.status_code >= 400:
-					# Log error but don't raise - we want to fail silently
-					logger.debug(
-						f'Failed to send sync event: POST {response.request.url} {response.status_code} - {response.text}'
-					)
+			if response.status_code == 401 and self.auth_client and not self.auth_client.is_authenticated:
+				# Store event for retry after auth
+				self.pending_events.append(event)
+			elif response.status_code >= 400:
+				# Log error but don't raise - we want to fail silently
+				logger.debug(
+					f'Failed to send sync event: POST {response.request.url} {response.status_code} - {response.text}'
+				)
 		except httpx.TimeoutException:
 			logger.warning(f'Event send timed out after 10 seconds: {event}')
 		except httpx.ConnectError as e:
@@ -140,12 +178,14 @@ class CloudSync:
 		if not self.pending_events:
 			return
 
-		# Send all pending events
-		for event in self.pending_events:
-			try:
-				await self._send_event(event)
-			except Exception as e:
-				logger.warning(f'Failed to resend pending event: {e}')
+		# Send all pending events over a dedicated client: this runs from the background auth task, which can
+		# outlive the agent that owns the shared client and its close(), so it must neither depend on nor recreate it
+		async with httpx.AsyncClient() as client:
+			for event in self.pending_events:
+				try:
+					await self._send_event(event, client=client)
+				except Exception as e:
+					logger.warning(f'Failed to resend pending event: {e}')
 
 		self.pending_events.clear()
 
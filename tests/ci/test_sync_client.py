@@ -1,7 +1,9 @@
 """Tests for CloudSync client machinery - retry logic, event handling, backend communication."""
 
+import asyncio
 import os
 import tempfile
+import threading
 from pathlib import Path
 
 import httpx
@@ -333,6 +335,185 @@ class TestCloudSyncRetryLogic:
 		assert sorted(task_values) == sorted(expected_tasks)
 
 
+class TestCloudSyncClientLifecycle:
+	"""Test the shared HTTP client CloudSync reuses across event posts."""
+
+	@pytest.fixture
+	def sync_with_auth(self, httpserver: HTTPServer, http_client, temp_config_dir):
+		"""Create CloudSync with auth."""
+		auth = DeviceAuthClient(base_url=httpserver.url_for(''), http_client=http_client)
+		auth.auth_config.api_token = 'test-api-key'
+		auth.auth_config.user_id = 'test-user-123'
+
+		service = CloudSync(base_url=httpserver.url_for(''), enable_auth=True)
+		service.auth_client = auth
+		service.session_id = 'test-session-id'
+		return service
+
+	@staticmethod
+	def _make_event(task: str) -> CreateAgentTaskEvent:
+		return CreateAgentTaskEvent(
+			agent_session_id='test-session',
+			llm_model='test-model',
+			task=task,
+			user_id='test-user-123',
+			device_id='test-device-id',
+			done_output=None,
+			user_feedback_type=None,
+			user_comment=None,
+			gif_url=None,
+		)
+
+	@staticmethod
+	def _capture_requests(httpserver: HTTPServer) -> list:
+		requests = []
+
+		def capture_request(request):
+			requests.append(request.get_json())
+			from werkzeug.wrappers import Response
+
+			return Response('{"processed": 1, "failed": 0}', status=200, mimetype='application/json')
+
+		httpserver.expect_request('/api/v1/events', method='POST').respond_with_handler(capture_request)
+		return requests
+
+	async def test_events_reuse_one_client(self, httpserver: HTTPServer, sync_with_auth):
+		"""Test that consecutive events are posted over the same client."""
+		requests = self._capture_requests(httpserver)
+
+		await sync_with_auth.handle_event(self._make_event('Task 1'))
+		first_client = sync_with_auth._client
+		await sync_with_auth.handle_event(self._make_event('Task 2'))
+
+		assert len(requests) == 2
+		assert first_client is not None
+		assert sync_with_auth._client is first_client
+		assert not first_client.is_closed
+
+		await sync_with_auth.close()
+
+	async def test_close_closes_and_resets_client(self, httpserver: HTTPServer, sync_with_auth):
+		"""Test that close() closes the shared client and drops it."""
+		self._capture_requests(httpserver)
+
+		await sync_with_auth.handle_event(self._make_event('Task before close'))
+		client = sync_with_auth._client
+		assert client is not None
+
+		await sync_with_auth.close()
+
+		assert client.is_closed
+		assert sync_with_auth._client is None
+
+	async def test_event_after_close_still_arrives(self, httpserver: HTTPServer, sync_with_auth):
+		"""Test that a closed CloudSync lazily creates a new client for later events."""
+		requests = self._capture_requests(httpserver)
+
+		await sync_with_auth.handle_event(self._make_event('Task before close'))
+		await sync_with_auth.close()
+		await sync_with_auth.handle_event(self._make_event('Task after close'))
+
+		assert [req['events'][0]['task'] for req in requests] == ['Task before close', 'Task after close']
+		assert sync_with_auth._client is not None
+		assert not sync_with_auth._client.is_closed
+
+		await sync_with_auth.close()
+
+	@staticmethod
+	def _block_requests(httpserver: HTTPServer, gates: dict[str, threading.Event]) -> tuple[list, dict[str, threading.Event]]:
+		"""Hold each POST in the server handler until the gate for its task is set."""
+		requests = []
+		received = {task: threading.Event() for task in gates}
+
+		def blocking_handler(request):
+			task = request.get_json()['events'][0]['task']
+			received[task].set()
+			gates[task].wait(timeout=10)
+			requests.append(request.get_json())
+			from werkzeug.wrappers import Response
+
+			return Response('{"processed": 1, "failed": 0}', status=200, mimetype='application/json')
+
+		httpserver.expect_request('/api/v1/events', method='POST').respond_with_handler(blocking_handler)
+		return requests, received
+
+	async def test_close_during_in_flight_request_is_deferred(self, httpserver: HTTPServer, sync_with_auth):
+		"""Test that close() while a POST is in flight lets it finish, then closes the client."""
+		gate = threading.Event()
+		requests, received = self._block_requests(httpserver, {'In-flight task': gate})
+
+		send_task = asyncio.create_task(sync_with_auth.handle_event(self._make_event('In-flight task')))
+		assert await asyncio.to_thread(received['In-flight task'].wait, 10)
+		client = sync_with_auth._client
+		assert client is not None
+
+		await sync_with_auth.close()
+
+		# Client must stay open while the request is still using it
+		assert sync_with_auth._client is client
+		assert not client.is_closed
+		assert sync_with_auth._close_client_when_idle is True
+
+		gate.set()
+		await send_task
+
+		assert [req['events'][0]['task'] for req in requests] == ['In-flight task']
+		assert client.is_closed
+		assert sync_with_auth._client is None
+		assert sync_with_auth._close_client_when_idle is False
+		assert sync_with_auth._client_requests_in_flight == 0
+
+	async def test_deferred_close_waits_for_last_request(self, httpserver: HTTPServer, sync_with_auth):
+		"""Test that a request started during the deferred-close window keeps the client open until it finishes."""
+		gates = {'First task': threading.Event(), 'Second task': threading.Event()}
+		requests, received = self._block_requests(httpserver, gates)
+
+		first = asyncio.create_task(sync_with_auth.handle_event(self._make_event('First task')))
+		assert await asyncio.to_thread(received['First task'].wait, 10)
+		client = sync_with_auth._client
+		assert client is not None
+
+		await sync_with_auth.close()
+
+		# Start another request during the deferred window, it must borrow the same still-open client
+		second = asyncio.create_task(sync_with_auth.handle_event(self._make_event('Second task')))
+		for _ in range(100):
+			if sync_with_auth._client_requests_in_flight == 2:
+				break
+			await asyncio.sleep(0.01)
+		assert sync_with_auth._client_requests_in_flight == 2
+		assert sync_with_auth._client is client
+
+		gates['First task'].set()
+		await first
+
+		# The second request is still in flight, so the client must not be closed yet
+		assert await asyncio.to_thread(received['Second task'].wait, 10)
+		assert sync_with_auth._client_requests_in_flight == 1
+		assert not client.is_closed
+		assert sync_with_auth._client is client
+
+		gates['Second task'].set()
+		await second
+
+		assert sorted(req['events'][0]['task'] for req in requests) == ['First task', 'Second task']
+		assert client.is_closed
+		assert sync_with_auth._client is None
+		assert sync_with_auth._close_client_when_idle is False
+
+	async def test_resend_after_close_does_not_recreate_shared_client(self, httpserver: HTTPServer, sync_with_auth):
+		"""Test that resending pending events after close() delivers them without leaving a shared client open."""
+		requests = self._capture_requests(httpserver)
+
+		await sync_with_auth.close()
+		sync_with_auth.pending_events.append(self._make_event('Pending task'))
+		await sync_with_auth._resend_pending_events()
+
+		assert len(requests) == 1
+		assert requests[0]['events'][0]['task'] == 'Pending task'
+		assert sync_with_auth._client is None
+
+
 class TestCloudSyncBackendCommunication:
 	"""Test CloudSync backend communication patterns."""
 